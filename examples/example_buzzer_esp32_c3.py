@@ -22,7 +22,7 @@ async def main():
     buzzer.add(async_buzzer.tabs_to_notes("S_ G4 D5 C5 G4 B4- B4 C5- G4 C5 G4 B4- B4 C5- G4 D5 C5 G4 B4- B4 C5- G4 C5 E5 D5- C5 D5-", 3, 400))
     buzzer.add(async_buzzer.tabs_to_notes('S_', 4, 150)) # Stay silent a moment
     # Say Hello World in Tunetalk
-    buzzer.add(async_buzzer.tabs_to_notes(async_buzzer.text_to_tunetalk_tabs('Hello World'), 3, 180))
+    buzzer.add(async_buzzer.text_to_tunetalk_notes('Hello World', 3, 180))
     buzzer.add(async_buzzer.tabs_to_notes('S_', 4, 150)) # Stay silent a moment
     # Make a siren sound
     buzzer.add(async_buzzer.siren())
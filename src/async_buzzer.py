@@ -4,8 +4,9 @@ Some functions use a default volume that can be changed using the global variabl
 """
 
 import machine
-import time
 import uasyncio
+from uasyncio import sleep_ms as _sleep_ms
+import ustruct
 
 DEFAULT_VOLUME = 3
 
@@ -28,21 +29,46 @@ class AsyncI2CBuzzer:
         self.i2c = i2c
         self.addr = addr
         self.notes_to_play = []
+        # index of the next note to play, notes before it are dropped by batches
+        self._next_note = 0
         self.player_task = None
+        # set when replace interrupts a note, so the next silence is sent to stop it
+        self._stop_pending = False
+        # register 3 followed by the note payload, written in a single transaction
+        self._buf = bytearray(7)
+        self._buf[0] = 3
         
     def __send_note(self, freq, volume, duration):
-        msg = freq.to_bytes(2, 'big') + volume.to_bytes(1, 'big') + duration.to_bytes(2, 'big') + b'\x01'
-        t0 = time.ticks_us()
-        self.i2c.writeto_mem(self.addr, 3, msg)
+        ustruct.pack_into('>HBHB', self._buf, 1, freq, volume, duration, 1)
+        self.i2c.writeto(self.addr, self._buf)
         
     async def __play_notes(self):
-        while self.notes_to_play:
-            next_note = self.notes_to_play.pop(0)
+        notes_to_play = self.notes_to_play
+        while self._next_note < len(notes_to_play):
+            next_note = notes_to_play[self._next_note]
+            self._next_note += 1
+            # list.pop(0) would shift every remaining note, instead played notes
+            # are removed once they make up half of the playlist
+            if self._next_note >= 32 and 2*self._next_note >= len(notes_to_play):
+                del notes_to_play[:self._next_note]
+                self._next_note = 0
+            # when notes play one after the other, the previous note ends by itself
+            # before a silence starts, so the silence does not need to be sent over I2C.
+            # After replace interrupted a note, the silence is sent to stop it.
+            if next_note[0] == 0 and not self._stop_pending:
+                await _sleep_ms(next_note[2])
+                continue
+            self._stop_pending = False
             # send note but only for 99% of the duration, to avoid
             # a race condition between the buzzer's I2C and note playing
-            self.__send_note(next_note[0], next_note[1], int(0.99*next_note[2]))
-            await uasyncio.sleep_ms(next_note[2])
+            duration = next_note[2]
+            self.__send_note(next_note[0], next_note[1], duration*99//100)
+            # nothing runs between the write and this sleep, so other tasks get
+            # the scheduler right away; an extra sleep_ms(0) would only add a wake-up
+            await _sleep_ms(duration)
 
+        del notes_to_play[:]
+        self._next_note = 0
         self.player_task = None
             
     def add(self, notes: list):
@@ -57,10 +83,13 @@ class AsyncI2CBuzzer:
         """Stops what is currently playing and replaces it with the provided note list. 
         
         See class description for the definition on notes"""
-        self.notes_to_play = notes
         if self.player_task:
             self.player_task.cancel()
-        self.player_task = uasyncio.create_task(self.__play_notes())
+            self.player_task = None
+            self._stop_pending = True
+        del self.notes_to_play[:]
+        self._next_note = 0
+        self.add(notes)
         
     def is_playing(self):
         """Returns True if the playlist is still actively playing."""
@@ -159,7 +188,36 @@ class Pitches:
     CS8 = 4435
     D8 = 4699
     DS8 = 4978
+
+_PITCH = {k: getattr(Pitches, k) for k in dir(Pitches) if not k.startswith('_')}
         
+def _coalesce_silences(notes):
+    """Returns a copy of the playlist where consecutive silent notes are merged into one"""
+    merged = []
+    # merged silences of the same duration share a single tuple
+    silences = {}
+    for note in notes:
+        if note[0] == 0 and merged and merged[-1][0] == 0:
+            duration = merged[-1][2] + note[2]
+            silence = silences.get(duration)
+            if silence is None:
+                silence = silences[duration] = (0, 0, duration)
+            merged[-1] = silence
+        else:
+            merged.append(note)
+    return merged
+
+# patterns are bytes so that iterating them gives ints, 46 being ord('.')
+_MORSE = {
+    'a': b'.-', 'b': b'-...', 'c': b'-.-.', 'd': b'-..', 'e': b'.', 'f': b'..-.',
+    'g': b'--.', 'h': b'....', 'i': b'..', 'j': b'.---', 'k': b'-.-', 'l': b'.-..',
+    'm': b'--', 'n': b'-.', 'o': b'---', 'p': b'.--.', 'q': b'--.-', 'r': b'.-.',
+    's': b'...', 't': b'-', 'u': b'..-', 'v': b'...-', 'w': b'.--', 'x': b'-..-',
+    'y': b'-.--', 'z': b'--..',
+    '1': b'.----', '2': b'..---', '3': b'...--', '4': b'....-', '5': b'.....',
+    '6': b'-....', '7': b'--...', '8': b'---..', '9': b'----.', '0': b'-----',
+}
+
 def text_to_morse_notes(text, short_note, long_note = None, sep_units = (1, 3, 7)):
     """Translates text to music notes using Morse code.
     
@@ -178,86 +236,35 @@ def text_to_morse_notes(text, short_note, long_note = None, sep_units = (1, 3, 7
     letter_sep = (Pitches.S, 0, int(sep_units[1]*short_note[2]))
     word_sep = (Pitches.S, 0, int(sep_units[2]*short_note[2]))
         
+    # notes of each symbol are built on first use, then reused as a tuple
+    letters = {' ': (word_sep,)}
     morse_notes = []
+    extend = morse_notes.extend
     for symbol in text:
         symbol = symbol.lower()
-        if symbol == ' ':
-            morse_notes.extend([word_sep])
-        elif symbol == 'a':
-            morse_notes.extend([short_note, silent_note, long_note, letter_sep])
-        elif symbol == 'b':
-            morse_notes.extend([long_note, silent_note, short_note, silent_note, short_note, silent_note, short_note, letter_sep])
-        elif symbol == 'c':
-            morse_notes.extend([long_note, silent_note, short_note, silent_note, long_note, silent_note, short_note, letter_sep])
-        elif symbol == 'd':
-            morse_notes.extend([long_note, silent_note, short_note, silent_note, short_note, letter_sep])
-        elif symbol == 'e':
-            morse_notes.extend([short_note, letter_sep])
-        elif symbol == 'f':
-            morse_notes.extend([short_note, silent_note, short_note, silent_note, long_note, silent_note, short_note, letter_sep])
-        elif symbol == 'g':
-            morse_notes.extend([long_note, silent_note, long_note, silent_note, short_note, letter_sep])
-        elif symbol == 'h':
-            morse_notes.extend([short_note, silent_note, short_note, silent_note, short_note, silent_note, short_note, letter_sep])
-        elif symbol == 'i':
-            morse_notes.extend([short_note, silent_note, short_note, letter_sep])
-        elif symbol == 'j':
-            morse_notes.extend([short_note, silent_note, long_note, silent_note, long_note, silent_note, long_note, letter_sep])
-        elif symbol == 'k':
-            morse_notes.extend([long_note, silent_note, short_note, silent_note, long_note, letter_sep])
-        elif symbol == 'l':
-            morse_notes.extend([short_note, silent_note, long_note, silent_note, short_note, silent_note, short_note, letter_sep])
-        elif symbol == 'm':
-            morse_notes.extend([long_note, silent_note, long_note, letter_sep])
-        elif symbol == 'n':
-            morse_notes.extend([long_note, silent_note, short_note, letter_sep])
-        elif symbol == 'o':
-            morse_notes.extend([long_note, silent_note, long_note, silent_note, long_note, letter_sep])
-        elif symbol == 'p':
-            morse_notes.extend([short_note, silent_note, long_note, silent_note, long_note, silent_note, short_note, letter_sep])
-        elif symbol == 'q':
-            morse_notes.extend([long_note, silent_note, long_note, silent_note, short_note, silent_note, long_note, letter_sep])
-        elif symbol == 'r':
-            morse_notes.extend([short_note, silent_note, long_note, silent_note, short_note, letter_sep])
-        elif symbol == 's':
-            morse_notes.extend([short_note, silent_note, short_note, silent_note, short_note, letter_sep])
-        elif symbol == 't':
-            morse_notes.extend([long_note, letter_sep])
-        elif symbol == 'u':
-            morse_notes.extend([short_note, silent_note, short_note, silent_note, long_note, letter_sep])
-        elif symbol == 'v':
-            morse_notes.extend([short_note, silent_note, short_note, silent_note, short_note, silent_note, long_note, letter_sep])
-        elif symbol == 'w':
-            morse_notes.extend([short_note, silent_note, long_note, silent_note, long_note, letter_sep])
-        elif symbol == 'x':
-            morse_notes.extend([long_note, silent_note, short_note, silent_note, short_note, silent_note, long_note, letter_sep])
-        elif symbol == 'y':
-            morse_notes.extend([long_note, silent_note, short_note, silent_note, long_note, silent_note, long_note, letter_sep])
-        elif symbol == 'z':
-            morse_notes.extend([long_note, silent_note, long_note, silent_note, short_note, silent_note, short_note, letter_sep])
-        elif symbol == '1':
-            morse_notes.extend([short_note, silent_note, long_note, silent_note, long_note, silent_note, long_note, silent_note, long_note, letter_sep])
-        elif symbol == '2':
-            morse_notes.extend([short_note, silent_note, short_note, silent_note, long_note, silent_note, long_note, silent_note, long_note, letter_sep])
-        elif symbol == '3':
-            morse_notes.extend([short_note, silent_note, short_note, silent_note, short_note, silent_note, long_note, silent_note, long_note, letter_sep])
-        elif symbol == '4':
-            morse_notes.extend([short_note, silent_note, short_note, silent_note, short_note, silent_note, short_note, silent_note, long_note, letter_sep])
-        elif symbol == '5':
-            morse_notes.extend([short_note, silent_note, short_note, silent_note, short_note, silent_note, short_note, silent_note, short_note, letter_sep])
-        elif symbol == '6':
-            morse_notes.extend([long_note, silent_note, short_note, silent_note, short_note, silent_note, short_note, silent_note, short_note, letter_sep])
-        elif symbol == '7':
-            morse_notes.extend([long_note, silent_note, long_note, silent_note, short_note, silent_note, short_note, silent_note, short_note, letter_sep])
-        elif symbol == '8':
-            morse_notes.extend([long_note, silent_note, long_note, silent_note, long_note, silent_note, short_note, silent_note, short_note, letter_sep])
-        elif symbol == '9':
-            morse_notes.extend([long_note, silent_note, long_note, silent_note, long_note, silent_note, long_note, silent_note, short_note, letter_sep])
-        elif symbol == '0':
-            morse_notes.extend([long_note, silent_note, long_note, silent_note, long_note, silent_note, long_note, silent_note, long_note, letter_sep])
+        letter = letters.get(symbol)
+        if letter is None:
+            pattern = _MORSE.get(symbol)
+            if pattern is None:
+                continue
+            letter = []
+            for i, c in enumerate(pattern):
+                if i:
+                    letter.append(silent_note)
+                letter.append(short_note if c == 46 else long_note)
+            letter.append(letter_sep)
+            letter = letters[symbol] = tuple(letter)
+        extend(letter)
             
-    return morse_notes
+    return _coalesce_silences(morse_notes)
     
+# note lengths in 24ths of unit_length, so that they can be computed with integer math
+_LEN_MULT = {'!': 3, ':': 6, ';': 8, '.': 12, '*': 36, '-': 48, '~': 72, '_': 96}
+
+# (pitch, length multiplier) of already parsed tab notes, emptied when it reaches _TOKEN_CACHE_SIZE
+_TOKEN_CACHE = {}
+_TOKEN_CACHE_SIZE = 64
+
 def tabs_to_notes(tabs, volume = None, unit_length = 400):
     """Converts text containing tabs to note list.
     
@@ -283,36 +290,41 @@ def tabs_to_notes(tabs, volume = None, unit_length = 400):
         volume = DEFAULT_VOLUME
     
     notes = []
+    notes_append = notes.append
+    # identical tab notes share a single tuple, silences included
+    built = {}
     
     for txt_note in tabs.split(' '):
-        if txt_note[-1] in '!:;.*-~_':
-            if txt_note[-1] == '!':
-                length = unit_length/8
-            if txt_note[-1] == ':':
-                length = unit_length/4
-            if txt_note[-1] == ';':
-                length = unit_length/3
-            if txt_note[-1] == '.':
-                length = unit_length/2
-            if txt_note[-1] == '*':
-                length = 3*unit_length/2
-            if txt_note[-1] == '-':
-                length = 2*unit_length
-            if txt_note[-1] == '~':
-                length = 3*unit_length
-            if txt_note[-1] == '_':
-                length = 4*unit_length
-            txt_note = txt_note[:-1]
-        else:
-            length = unit_length
-            
-        pitch = getattr(Pitches, txt_note)
+        note = built.get(txt_note)
+        if note is None:
+            entry = _TOKEN_CACHE.get(txt_note)
+            if entry is None:
+                mult = _LEN_MULT.get(txt_note[-1])
+                if mult is not None:
+                    entry = (_PITCH[txt_note[:-1]], mult)
+                else:
+                    entry = (_PITCH[txt_note], 24)
+                if len(_TOKEN_CACHE) >= _TOKEN_CACHE_SIZE:
+                    _TOKEN_CACHE.clear()
+                _TOKEN_CACHE[txt_note] = entry
+            note = built[txt_note] = (entry[0], volume, int(unit_length*entry[1]//24))
         
-        notes.append((pitch, volume, int(length)))
+        notes_append(note)
         
-    return notes 
+    return _coalesce_silences(notes)
     
     
+_TUNETALK = {
+    ' ': 'S- S:',
+    'a': 'F{o}- S:', 'b': 'E{o} C{o} S:', 'c': 'A{o} D{o} S:', 'd': 'F{o} D{o} S:',
+    'e': 'A{o}- S:', 'f': 'E{o} A{o} S:', 'g': 'D{o} C{o} S:', 'h': 'G{o} A{o} S:',
+    'i': 'B{o}- S:', 'j': 'A{o} B{o} S:', 'k': 'A{o} F{o} S:', 'l': 'D{o} F{o} S:',
+    'm': 'F{o} A{o} S:', 'n': 'E{o} G{o} S:', 'o': 'E{o}- S:', 'p': 'G{o} E{o} S:',
+    'q': 'A{o} E{o} S:', 'r': 'D{o} G{o} S:', 's': 'F{o} B{o} S:', 't': 'B{o} G{o} S:',
+    'u': 'D{o}- S:', 'v': 'C{o} E{o} S:', 'w': 'C{o} F{o} S:', 'x': 'A{o} C{o} S:',
+    'y': 'G{o}- S:', 'z': 'G{o} D{o} S:',
+}
+
 def text_to_tunetalk_tabs(text, octave = 4):
     """Translates a text to a tune in the form of tabs.
     
@@ -322,68 +334,61 @@ def text_to_tunetalk_tabs(text, octave = 4):
     the octave argument is an integer that allows to choose the pitch by octave increments
     """
     
-    tabs = ''
     octave = str(octave)
+    table = {k: v.replace('{o}', octave) for k, v in _TUNETALK.items()}
     
+    parts = []
+    append = parts.append
     for symbol in text:
-        symbol = symbol.lower()
-        if symbol == ' ':
-            tabs += 'S- S: '
-        elif symbol == 'a':
-            tabs += 'F'+octave+'- S: '
-        elif symbol == 'b':
-            tabs += 'E'+octave+' C'+octave+' S: ' 
-        elif symbol == 'c':
-            tabs += 'A'+octave+' D'+octave+' S: ' 
-        elif symbol == 'd':
-            tabs += 'F'+octave+' D'+octave+' S: ' 
-        elif symbol == 'e':
-            tabs += 'A'+octave+'- S: '
-        elif symbol == 'f':
-            tabs += 'E'+octave+' A'+octave+' S: ' 
-        elif symbol == 'g':
-            tabs += 'D'+octave+' C'+octave+' S: ' 
-        elif symbol == 'h':
-            tabs += 'G'+octave+' A'+octave+' S: ' 
-        elif symbol == 'i':
-            tabs += 'B'+octave+'- S: '
-        elif symbol == 'j':
-            tabs += 'A'+octave+' B'+octave+' S: ' 
-        elif symbol == 'k':
-            tabs += 'A'+octave+' F'+octave+' S: ' 
-        elif symbol == 'l':
-            tabs += 'D'+octave+' F'+octave+' S: ' 
-        elif symbol == 'm':
-            tabs += 'F'+octave+' A'+octave+' S: ' 
-        elif symbol == 'n':
-            tabs += 'E'+octave+' G'+octave+' S: ' 
-        elif symbol == 'o':
-            tabs += 'E'+octave+'- S: '
-        elif symbol == 'p':
-            tabs += 'G'+octave+' E'+octave+' S: ' 
-        elif symbol == 'q':
-            tabs += 'A'+octave+' E'+octave+' S: ' 
-        elif symbol == 'r':
-            tabs += 'D'+octave+' G'+octave+' S: ' 
-        elif symbol == 's':
-            tabs += 'F'+octave+' B'+octave+' S: ' 
-        elif symbol == 't':
-            tabs += 'B'+octave+' G'+octave+' S: ' 
-        elif symbol == 'u':
-            tabs += 'D'+octave+'- S: '
-        elif symbol == 'v':
-            tabs += 'C'+octave+' E'+octave+' S: ' 
-        elif symbol == 'w':
-            tabs += 'C'+octave+' F'+octave+' S: ' 
-        elif symbol == 'x':
-            tabs += 'A'+octave+' C'+octave+' S: ' 
-        elif symbol == 'y':
-            tabs += 'G'+octave+'- S: '
-        elif symbol == 'z':
-            tabs += 'G'+octave+' D'+octave+' S: ' 
+        p = table.get(symbol.lower())
+        if p:
+            append(p)
             
-    return tabs[:-1]
+    return ' '.join(parts)
+
+def text_to_tunetalk_notes(text, volume = None, unit_length = 400, octave = 4):
+    """Translates a text to a tune in the form of a note list.
+    
+    Gives the same notes as tabs_to_notes(text_to_tunetalk_tabs(text, octave), volume, unit_length)
+    without building and parsing the intermediate tabs string.
+    volume: integer between 0 and 4 included. If not provided, DEFAULT_VOLUME is used
+    unit_length: integer, length of a regular note, in milliseconds
+    octave: an integer that allows to choose the pitch by octave increments
+    """
     
+    octave = str(octave)
+    # notes of each letter are built on first use, then reused as a tuple
+    letters = {}
+    notes = []
+    extend = notes.extend
+    for symbol in text:
+        symbol = symbol.lower()
+        letter = letters.get(symbol)
+        if letter is None:
+            pattern = _TUNETALK.get(symbol)
+            if pattern is None:
+                continue
+            letter = letters[symbol] = tuple(tabs_to_notes(pattern.replace('{o}', octave), volume, unit_length))
+        extend(letter)
+        
+    return _coalesce_silences(notes)
+
+_YES = ((Pitches.C5, 150), (Pitches.E5, 250))
+_NO = ((Pitches.C5, 200), (Pitches.A4, 300))
+_WRONG = ((Pitches.C3, 800),)
+_VICTORY = ((Pitches.C5, 150), (Pitches.E5, 150), (Pitches.C5, 150), (Pitches.F5, 300))
+_LAUGH = ((Pitches.F5, 100), (Pitches.E5, 200))*4
+_SAD = ((Pitches.F4, 400), (Pitches.E4, 400), (Pitches.DS4, 400), (Pitches.D4, 400))
+_SIREN = ((Pitches.FS5, 400), (Pitches.C5, 400))*4
+
+def _tune(pattern, freq_scaling, volume, duration_scaling):
+    """Builds a note list from a tuple of (frequency, duration) pairs"""
+    if volume == None:
+        volume = DEFAULT_VOLUME
+    if freq_scaling == 1.0 and duration_scaling == 1.0:
+        return [(freq, volume, duration) for freq, duration in pattern]
+    return [(int(freq_scaling*freq), volume, int(duration_scaling*duration)) for freq, duration in pattern]
+
 def yes(freq_scaling = 1.0, volume = None, duration_scaling = 1.0):
     """Make a "yes" tune
     
@@ -391,10 +396,7 @@ def yes(freq_scaling = 1.0, volume = None, duration_scaling = 1.0):
     volume: integer between 0 and 4 included. If not provided, DEFAULT_VOLUME is used
     duration_scaling: a float that scales the duration of the notes 
     """
-    if volume == None:
-        volume = DEFAULT_VOLUME
-    return [(int(freq_scaling*Pitches.C5), volume, int(duration_scaling*150)),
-            (int(freq_scaling*Pitches.E5), volume, int(duration_scaling*250))]
+    return _tune(_YES, freq_scaling, volume, duration_scaling)
 
 def no(freq_scaling = 1.0, volume = None, duration_scaling = 1.0):
     """Make a "no" tune
@@ -403,10 +405,7 @@ def no(freq_scaling = 1.0, volume = None, duration_scaling = 1.0):
     volume: integer between 0 and 4 included. If not provided, DEFAULT_VOLUME is used
     duration_scaling: a float that scales the duration of the notes 
     """
-    if volume == None:
-        volume = DEFAULT_VOLUME
-    return [(int(freq_scaling*Pitches.C5), volume, int(duration_scaling*200)),
-            (int(freq_scaling*Pitches.A4), volume, int(duration_scaling*300))]
+    return _tune(_NO, freq_scaling, volume, duration_scaling)
 
 def wrong(freq_scaling = 1.0, volume = None, duration_scaling = 1.0):
     """Make a "wrong!" tune
@@ -415,9 +414,7 @@ def wrong(freq_scaling = 1.0, volume = None, duration_scaling = 1.0):
     volume: integer between 0 and 4 included. If not provided, DEFAULT_VOLUME is used
     duration_scaling: a float that scales the duration of the notes 
     """
-    if volume == None:
-        volume = DEFAULT_VOLUME
-    return [(int(freq_scaling*Pitches.C3), volume, int(duration_scaling*800))]
+    return _tune(_WRONG, freq_scaling, volume, duration_scaling)
 
 def victory(freq_scaling = 1.0, volume = None, duration_scaling = 1.0):
     """Make a "vixtory" tune
@@ -426,12 +423,7 @@ def victory(freq_scaling = 1.0, volume = None, duration_scaling = 1.0):
     volume: integer between 0 and 4 included. If not provided, DEFAULT_VOLUME is used
     duration_scaling: a float that scales the duration of the notes 
     """
-    if volume == None:
-        volume = DEFAULT_VOLUME
-    return [(int(freq_scaling*Pitches.C5), volume, int(duration_scaling*150)),
-            (int(freq_scaling*Pitches.E5), volume, int(duration_scaling*150)),
-            (int(freq_scaling*Pitches.C5), volume, int(duration_scaling*150)),
-            (int(freq_scaling*Pitches.F5), volume, int(duration_scaling*300))]
+    return _tune(_VICTORY, freq_scaling, volume, duration_scaling)
 
 def laugh(freq_scaling = 1.0, volume = None, duration_scaling = 1.0):
     """Make a "laugh" tune
@@ -440,17 +432,7 @@ def laugh(freq_scaling = 1.0, volume = None, duration_scaling = 1.0):
     volume: integer between 0 and 4 included. If not provided, DEFAULT_VOLUME is used
     duration_scaling: a float that scales the duration of the notes 
     """
-    if volume == None:
-        volume = DEFAULT_VOLUME
-    return [(int(freq_scaling*Pitches.F5), volume, int(duration_scaling*100)),
-            (int(freq_scaling*Pitches.E5), volume, int(duration_scaling*200)),
-            (int(freq_scaling*Pitches.F5), volume, int(duration_scaling*100)),
-            (int(freq_scaling*Pitches.E5), volume, int(duration_scaling*200)),
-            (int(freq_scaling*Pitches.F5), volume, int(duration_scaling*100)),
-            (int(freq_scaling*Pitches.E5), volume, int(duration_scaling*200)),
-            (int(freq_scaling*Pitches.F5), volume, int(duration_scaling*100)),
-            (int(freq_scaling*Pitches.E5), volume, int(duration_scaling*200))]
-            
+    return _tune(_LAUGH, freq_scaling, volume, duration_scaling)
 
 def sad(freq_scaling = 1.0, volume = None, duration_scaling = 1.0):
     """Make a "sad" tune
@@ -459,13 +441,8 @@ def sad(freq_scaling = 1.0, volume = None, duration_scaling = 1.0):
     volume: integer between 0 and 4 included. If not provided, DEFAULT_VOLUME is used
     duration_scaling: a float that scales the duration of the notes 
     """
-    if volume == None:
-        volume = DEFAULT_VOLUME
-    return [(int(freq_scaling*Pitches.F4), volume, int(duration_scaling*400)),
-            (int(freq_scaling*Pitches.E4), volume, int(duration_scaling*400)),
-            (int(freq_scaling*Pitches.DS4), volume, int(duration_scaling*400)),
-            (int(freq_scaling*Pitches.D4), volume, int(duration_scaling*400))]
-            
+    return _tune(_SAD, freq_scaling, volume, duration_scaling)
+
 def siren(freq_scaling = 1.0, volume = None, duration_scaling = 1.0):
     """Make a "siren" tune
     
@@ -473,19 +450,4 @@ def siren(freq_scaling = 1.0, volume = None, duration_scaling = 1.0):
     volume: integer between 0 and 4 included. If not provided, DEFAULT_VOLUME is used
     duration_scaling: a float that scales the duration of the notes 
     """
-    if volume == None:
-        volume = DEFAULT_VOLUME
-    pass
-
-    return [(int(freq_scaling*Pitches.FS5), volume, int(duration_scaling*400)),
-            (int(freq_scaling*Pitches.C5), volume, int(duration_scaling*400)),
-            (int(freq_scaling*Pitches.FS5), volume, int(duration_scaling*400)),
-            (int(freq_scaling*Pitches.C5), volume, int(duration_scaling*400)),
-            (int(freq_scaling*Pitches.FS5), volume, int(duration_scaling*400)),
-            (int(freq_scaling*Pitches.C5), volume, int(duration_scaling*400)),
-            (int(freq_scaling*Pitches.FS5), volume, int(duration_scaling*400)),
-            (int(freq_scaling*Pitches.C5), volume, int(duration_scaling*400))]
-
-            
-    
-
+    return _tune(_SIREN, freq_scaling, volume, duration_scaling)